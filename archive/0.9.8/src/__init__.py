@@ -25,7 +25,14 @@ from pathlib import Path
 
 from ._blob import BlobUpath
 from ._local import LocalPathType, LocalUpath
-from ._upath import FileInfo, LockAcquireError, LockReleaseError, PathType, Upath
+from ._upath import (
+    FileInfo,
+    LockAcquireError,
+    LockReleaseError,
+    PathType,
+    StaleReadError,
+    Upath,
+)
 
 try:
     from ._gcs import GcsBlobUpath
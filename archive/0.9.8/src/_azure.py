@@ -23,7 +23,9 @@ from io import BufferedReader, UnsupportedOperation
 from azure.core.exceptions import (
     HttpResponseError,
     ResourceExistsError,
+    ResourceModifiedError,
     ResourceNotFoundError,
+    map_error,
 )
 from azure.storage.blob import BlobClient, BlobLeaseClient, ContainerClient
 from typing_extensions import Self
@@ -45,6 +47,10 @@ class AzureBlobUpath(BlobUpath):
     _ACCOUNT_KEY = None
     _SAS_TOKEN = None
 
+    _REMOVE_DIR_BATCH_SIZE = 256
+    # Files are removed by batch requests in :meth:`_remove_files_at`.
+    # This is the max number of subrequests in one batch request set by Azure.
+
     @classmethod
     def get_account_info(cls):
         # Subclass needs to customize this method or
@@ -189,15 +195,14 @@ class AzureBlobUpath(BlobUpath):
 
     def _upload_file(self, source: LocalPathType, *, overwrite: bool = False):
         source = _resolve_local_path(source)
-        if self.is_file():
-            if not overwrite:
-                # TODO: check the behavior of `upload_blob` related to
-                # behavior about overwrite.
-                raise FileExistsError(f"File exists: '{self}'")
-            self.remove_file()
+        # `upload_blob` refuses to replace an existing blob unless `overwrite`
+        # is ``True``, hence there is no need to check for the blob beforehand.
         with self._provide_blob_client():
             with open(str(source), "rb") as data:
-                self._blob_client.upload_blob(data)
+                try:
+                    self._blob_client.upload_blob(data, overwrite=overwrite)
+                except ResourceExistsError as e:
+                    raise FileExistsError(f"File exists: '{self}'") from e
 
     def iterdir(self) -> Iterator[Self]:
         with self._provide_container_client():
@@ -335,6 +340,13 @@ class AzureBlobUpath(BlobUpath):
             except ResourceNotFoundError as e:
                 raise FileNotFoundError(f"No such file: '{self}'") from e
 
+    def _read_into(self, file) -> None:
+        with self._provide_blob_client():
+            try:
+                self._blob_client.download_blob().readinto(file)
+            except ResourceNotFoundError as e:
+                raise FileNotFoundError(f"No such file: '{self}'") from e
+
     def remove_file(self):
         with self._provide_blob_client():
             try:
@@ -344,6 +356,39 @@ class AzureBlobUpath(BlobUpath):
             except ResourceNotFoundError:
                 raise FileNotFoundError(f"No such file: '{self}'")
 
+    def _remove_files_at(self, paths: list[str]) -> int:
+        # Delete the blobs by a single batch request rather than one request per blob.
+        # This runs in threads, hence uses its own client rather than
+        # `_provide_container_client`, which sets an attribute on `self`.
+        with ContainerClient(
+            container_name=self._container_name,
+            **self.get_account_info(),
+        ) as cc:
+            responses = cc.delete_blobs(
+                *(p[1:] for p in paths),
+                delete_snapshots="include",
+                raise_on_any_failure=False,
+            )
+            # Check the subrequests one by one rather than getting
+            # a `PartialBatchErrorException`, so that a missing blob is not an error.
+            n = 0
+            for path, resp in zip(paths, responses):
+                if resp.status_code == 404:
+                    # Already removed, e.g. by another worker.
+                    continue
+                if resp.status_code >= 300:
+                    # E.g. 412 if the blob has an active lease.
+                    map_error(
+                        resp.status_code,
+                        resp,
+                        {409: ResourceExistsError, 412: ResourceModifiedError},
+                    )
+                    raise HttpResponseError(
+                        message=f"Failed to remove '{path}'", response=resp
+                    )
+                n += 1
+        return n
+
     def riterdir(self) -> Iterator[Self]:
         with self._provide_container_client():
             prefix = self.blob_name + "/"
@@ -4,10 +4,12 @@ from __future__ import annotations
 # that defines this class.
 # https://stackoverflow.com/a/49872353
 # Will no longer be needed in Python 3.10.
+import concurrent.futures
 import contextlib
 import logging
 import os
 import time
+from collections import deque
 from collections.abc import Iterator
 from io import BufferedReader, BytesIO, UnsupportedOperation
 
@@ -17,6 +19,7 @@ from google.api_core.exceptions import (
     NotFound,
     PreconditionFailed,
     RetryError,
+    from_http_response,
 )
 from google.api_core.retry import Retry, if_exception_type
 from google.cloud import storage
@@ -65,6 +68,35 @@ NOTSET = object()
 assert hasattr(DEFAULT_RETRY, "with_timeout")
 
 
+def _listing_pool():
+    # Listing pages are small and latency-sensitive, hence get their own threads
+    # rather than queueing behind, e.g., the chunks of multipart downloads.
+    return get_shared_thread_pool("upathlib-gcs-listing", 16)
+
+
+def _prefetch_pages(blobs) -> Iterator:
+    """
+    Yield the items of the listing ``blobs`` (from ``Client.list_blobs``)
+    while the next page is fetched in a thread, so that the consumer does not
+    wait on a network round-trip at the start of every page.
+
+    ``blobs.prefixes`` is complete once the items are exhausted.
+    """
+    pages = blobs.pages
+    executor = _listing_pool()
+    fut = executor.submit(next, pages, None)
+    try:
+        while True:
+            page = fut.result()
+            if page is None:
+                return
+            items = list(page)
+            fut = executor.submit(next, pages, None)
+            yield from items
+    finally:
+        fut.cancel()
+
+
 class GcsBlobUpath(BlobUpath):
     """
     GcsBlobUpath implements the :class:`~upathlib.Upath` API for
@@ -78,6 +110,17 @@ class GcsBlobUpath(BlobUpath):
     # Hence this is safe with multiprocessing, be it forked or spawned.
     # In a "spawned" process, this will start as None.
 
+    _REMOVE_DIR_BATCH_SIZE: int = 100
+    # Files are removed by batch requests in :meth:`_remove_files_at`.
+    # This is the max number of calls in one batch request set by GCS.
+
+    _RITERDIR_CONCURRENCY: int = 8
+    # Max number of "subdirectories" that :meth:`riterdir` lists at the same time.
+
+    _RITERDIR_PAGES_AHEAD: int = 4
+    # Max number of pages of one "subdirectory" that :meth:`riterdir` fetches
+    # ahead of the consumer.
+
     _LOCK_EXPIRE_IN_SECONDS: int = 3600
     # Things performed while holding a `lock` should finish within
     # this many seconds. If a worker tries but fails to acquire a lock on a file,
@@ -433,6 +476,9 @@ class GcsBlobUpath(BlobUpath):
         else:
             self._multipart_download(file_size, file_obj)
 
+    def _read_into(self, file) -> None:
+        self._read_into_buffer(file)
+
     def read_bytes(self, **kwargs) -> bytes:
         """
         Return the content of the current blob as bytes.
@@ -508,11 +554,9 @@ class GcsBlobUpath(BlobUpath):
         filename = str(source)
         content_type = self._blob()._get_content_type(None, filename=filename)
 
-        if self.is_file():
-            if not overwrite:
-                raise FileExistsError(f"File exists: '{self}'")
-            self.remove_file()
-
+        # There is no check for an existing blob beforehand, which would take
+        # a request or two per file: `_write_from_buffer` makes the upload
+        # conditional on the blob not existing unless `overwrite` is ``True``.
         with open(filename, "rb") as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
             self._write_from_buffer(
@@ -566,7 +610,7 @@ class GcsBlobUpath(BlobUpath):
         prefix = self.blob_name + "/"
         k = len(prefix)
         blobs = self._client().list_blobs(self._bucket(), prefix=prefix, delimiter="/")
-        for p in blobs:
+        for p in _prefetch_pages(blobs):
             if p.name == prefix:
                 # This happens if users has used the dashboard to "create a folder".
                 # This seems to be a valid blob except its size is 0.
@@ -580,17 +624,46 @@ class GcsBlobUpath(BlobUpath):
             # If this is an "empty subfolder", it is counted but it can be
             # misleading. User should avoid creating such empty folders.
 
-    def remove_dir(self, **kwargs) -> int:
+    def remove_dir(self, *, quiet: bool = True, concurrent: bool = True) -> int:
         """
         Remove the current dir and all the content under it recursively.
         Return the number of blobs removed.
-        """
-        z = super().remove_dir(**kwargs)
-        prefix = self.blob_name + "/"
-        for p in self._client().list_blobs(self._bucket(), prefix=prefix):
-            assert p.name.endswith("/"), p.name
-            p.delete()
-        return z
+
+        Blobs are deleted by batch requests; see :meth:`_remove_files_at`.
+        """
+        n = super().remove_dir(quiet=quiet, concurrent=concurrent)
+        # `riterdir_paths` skips "empty folders", i.e. blobs whose names end with '/'.
+        # Remove those that are left, if any, without counting them.
+        paths = [
+            "/" + p.name
+            for p in self._client().list_blobs(
+                self._bucket(),
+                prefix=self.blob_name + "/",
+                fields="items(name),nextPageToken",
+            )
+        ]
+        for i in range(0, len(paths), self._REMOVE_DIR_BATCH_SIZE):
+            self._remove_files_at(paths[i : i + self._REMOVE_DIR_BATCH_SIZE])
+        return n
+
+    def _remove_files_at(self, paths: list[str]) -> int:
+        # Delete the blobs by a single batch request rather than one request per blob.
+        client = self._client()
+        bucket = self._bucket()
+        # Check the subrequests one by one rather than letting the batch raise
+        # for any failure, so that a missing blob is not an error.
+        with client.batch(raise_exception=False) as batch:
+            for path in paths:
+                bucket.delete_blob(path[1:], client=client)
+        n = 0
+        for resp in batch._responses:
+            if resp.status_code == 404:
+                # Already removed, e.g. by another worker.
+                continue
+            if not 200 <= resp.status_code < 300:
+                raise from_http_response(resp)
+            n += 1
+        return n
 
     def remove_file(self) -> None:
         """
@@ -605,15 +678,116 @@ class GcsBlobUpath(BlobUpath):
         """
         Yield all blobs recursively under the current dir.
         """
+        for path in self.riterdir_paths():
+            yield self._with_path(path)
+
+    def riterdir_paths(self) -> Iterator[str]:
+        """
+        Yield the paths, i.e. ``'/'`` followed by the blob names,
+        of all blobs recursively under the current dir.
+
+        The blobs directly under the current dir are listed first.
+        Then the immediate "subdirectories" are listed concurrently in threads,
+        a few at a time, because every page of a listing is a network round-trip.
+        Each listing is fetched a page at a time and only a few pages ahead
+        of the consumer, so that the items are yielded as soon as they arrive
+        and memory use is bounded.
+        """
         prefix = self.blob_name + "/"
-        k = len(prefix)
-        for p in self._client().list_blobs(self._bucket(), prefix=prefix):
-            if p.name.endswith("/"):
+        client = self._client()
+        bucket = self._bucket()
+
+        def _list_page(subprefix, page_token):
+            blobs = client.list_blobs(
+                bucket,
+                prefix=subprefix,
+                page_token=page_token,
+                fields="items(name),nextPageToken",
+            )
+            page = next(blobs.pages, None)
+            names = [
+                p.name
+                for p in (page or ())
+                if not p.name.endswith("/")
                 # This can be an "empty folder"---better not create them!
                 # Worse, this is an actual blob name---do not do this!
+            ]
+            return names, blobs.next_page_token
+
+        blobs = client.list_blobs(
+            bucket,
+            prefix=prefix,
+            delimiter="/",
+            fields="items(name),prefixes,nextPageToken",
+        )
+        for p in _prefetch_pages(blobs):
+            if p.name.endswith("/"):
                 continue
-            obj = self / p.name[k:]
-            yield obj
+            yield "/" + p.name
+        # `blobs.prefixes` is complete only after all pages have been consumed.
+        subprefixes = iter(sorted(blobs.prefixes))
+
+        executor = _listing_pool()
+        concurrency = self._RITERDIR_CONCURRENCY
+        pages_ahead = self._RITERDIR_PAGES_AHEAD
+
+        def _start(subprefix):
+            return subprefix, deque([executor.submit(_list_page, subprefix, None)])
+
+        def _extend(subprefix, pages):
+            # Request the next page once the previous one has arrived.
+            # A task never waits on another, hence the shared pool can not deadlock.
+            while len(pages) < pages_ahead and pages and pages[-1].done():
+                page_token = pages[-1].result()[1]
+                if page_token is None:
+                    break
+                pages.append(executor.submit(_list_page, subprefix, page_token))
+
+        def _finished(pages):
+            return pages[-1].done() and pages[-1].result()[1] is None
+
+        def _refill():
+            # Keep up to `concurrency` listings going, starting a new one as soon as
+            # any listing is finished, not only the one at the head.
+            # The pages that are waiting to be yielded are bounded in total.
+            for sp, pp in listings:
+                _extend(sp, pp)
+            active = sum(not _finished(pp) for _, pp in listings)
+            waiting = sum(len(pp) for _, pp in listings)
+            while active < concurrency and waiting < concurrency * pages_ahead:
+                sp = next(subprefixes, None)
+                if sp is None:
+                    break
+                listings.append(_start(sp))
+                active += 1
+                waiting += 1
+
+        # Each entry is a subprefix along with the pending pages of its listing, in order.
+        # Names are yielded in the order of the entries.
+        listings = deque()
+        try:
+            _refill()
+            while listings:
+                subprefix, pages = listings[0]
+                while not pages[0].done():
+                    concurrent.futures.wait(
+                        [pp[-1] for _, pp in listings if not pp[-1].done()],
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    _refill()
+                names, page_token = pages[0].result()
+                if len(pages) == 1 and page_token is not None:
+                    pages.append(executor.submit(_list_page, subprefix, page_token))
+                pages.popleft()
+                if not pages:
+                    listings.popleft()
+                _refill()
+                for name in names:
+                    yield "/" + name
+        finally:
+            for _, pages in listings:
+                for t in pages:
+                    t.cancel()
 
     def _acquire_lease(
         self,
@@ -627,7 +801,7 @@ class GcsBlobUpath(BlobUpath):
             raise UnsupportedOperation("can not write to root as a blob", self)
 
         t0 = time.perf_counter()
-        lockfile = self.with_suffix(self.suffix + ".lock")
+        lockfile = self._lock_file()
         try:
             try:
                 Retry(
@@ -679,7 +853,7 @@ class GcsBlobUpath(BlobUpath):
         # TODO:
         # once got "RemoteDisconnected" error after 0.01 seconds.
         t0 = time.perf_counter()
-        lockfile = self.with_suffix(self.suffix + ".lock")
+        lockfile = self._lock_file()
         try:
             try:
                 try:
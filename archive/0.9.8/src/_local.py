@@ -1,32 +1,48 @@
 from __future__ import annotations
 
+import codecs
 import contextlib
 import datetime
+import errno
 import os
 import os.path
 import pathlib
+import pickle
 import shutil
+import stat
 import sys
 import time
 from collections.abc import Iterator
-from io import BufferedReader
+from io import BufferedReader, UnsupportedOperation
+from typing import Any
+from uuid import uuid4
 
-import filelock
-
-# `filelock` is also called `py-filelock`.
-# Tried `fasteners` also. In one use case,
-# `filelock` worked whereas `fasteners.InterprocessLock` failed.
-#
-# Other options to look into include
-# `oslo.concurrency`, `pylocker`, `portalocker`.
-from ._upath import FileInfo, LockAcquireError, LockReleaseError, Upath
+from ._upath import FileInfo, LockAcquireError, LockReleaseError, Upath, _serializer
 
 # End user may want to do this:
 # logging.getLogger("filelock").setLevel(logging.WARNING)
 
 
-class LocalUpath(Upath, os.PathLike):
-    _LOCK_POLL_INTERVAL_SECONDS = 0.03
+_FICLONE = 0x40049409  # from <linux/fs.h>
+_NO_CLONE_DEVICES: set[int] = (
+    set()
+)  # `st_dev` of file systems found to not support cloning
+
+
+class LocalUpath(Upath):
+    # `os.PathLike` is not a base class because it does not declare `__slots__`,
+    # which would give every instance a `__dict__`. A ``LocalUpath`` is still
+    # recognized as an ``os.PathLike`` because it implements ``__fspath__``.
+    __slots__ = ("_lock",)
+
+    _LOCK_POLL_INTERVAL_SECONDS = 0.03  # max wait between attempts to acquire a lock
+    _REMOVE_DIR_BATCH_SIZE = 64
+    _DIR_TO_DIR_BATCH_SIZE = 8
+    _WRITE_TEXT_CHUNK_SIZE = 1 << 20  # number of characters encoded at a time
+    _CLONE_FILES = sys.platform == "linux"
+    # Whether :meth:`_copy_file` tries to clone a file by ``ioctl(FICLONE)``
+    # before copying its data. A file system that does not support it
+    # is remembered by its device, and is not tried again.
 
     def __init__(self, *pathsegments: str):
         """
@@ -37,7 +53,13 @@ class LocalUpath(Upath, os.PathLike):
         working directory. If missing, the constructed path is the current working directory.
         This is passed to `pathlib.Path <https://docs.python.org/3/library/pathlib.html#pathlib.Path>`_.
         """
-        super().__init__(str(pathlib.Path(*pathsegments).absolute()))
+        path = pathsegments[0] if len(pathsegments) == 1 else None
+        if os.sep == "/" and path.__class__ is str and path[:1] == "/":
+            # An absolute path, e.g. one derived from another path, needs no
+            # resolution by `pathlib`; `Upath.__init__` normalizes it.
+            super().__init__(path)
+        else:
+            super().__init__(str(pathlib.Path(*pathsegments).absolute()))
         self._lock = None
 
     def __fspath__(self) -> str:
@@ -57,7 +79,7 @@ class LocalUpath(Upath, os.PathLike):
         >>> p.rmrf()
         1
         """
-        return self.path.__fspath__()
+        return self._path
 
     def __getstate__(self):
         return None, super().__getstate__()
@@ -73,7 +95,10 @@ class LocalUpath(Upath, os.PathLike):
         Return the `pathlib.Path <https://docs.python.org/3/library/pathlib.html#pathlib.Path>`_ object
         of the path.
         """
-        return pathlib.Path(self._path)
+        p = self._path_obj
+        if p is None:
+            p = self._path_obj = pathlib.Path(self._path)
+        return p
 
     def as_uri(self) -> str:
         """
@@ -83,26 +108,41 @@ class LocalUpath(Upath, os.PathLike):
         """
         return self.path.as_uri()
 
+    def exists(self) -> bool:
+        """
+        Return whether the current path is an existing file or dir.
+        """
+        # A single `stat` rather than `is_file` followed by `is_dir`.
+        try:
+            mode = os.stat(self._path).st_mode
+        except (OSError, ValueError):
+            return False
+        return stat.S_ISREG(mode) or stat.S_ISDIR(mode)
+
     def is_dir(self) -> bool:
         """
         Return whether the current path is a dir.
         """
-        return self.path.is_dir()
+        return os.path.isdir(self._path)
 
     def is_file(self) -> bool:
         """
         Return whether the current path is a file.
         """
-        return self.path.is_file()
+        return os.path.isfile(self._path)
 
     def file_info(self) -> FileInfo | None:
         """
         Return file info if the current path is a file;
         otherwise return ``None``.
         """
-        if not self.is_file():
+        # A single `stat` rather than `is_file` followed by `stat`.
+        try:
+            st = os.stat(self._path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(st.st_mode):
             return None
-        st = self.path.stat()
         return FileInfo(
             ctime=st.st_ctime,
             mtime=st.st_mtime,
@@ -123,6 +163,8 @@ class LocalUpath(Upath, os.PathLike):
         On Windows, this is the root on the same drive, like ``LocalUpath('C:\')``.
         On Linux and Mac, this is ``LocalUpath('/')``.
         """
+        if os.sep == "/":
+            return self.__class__("/")
         return self.__class__(self.path.root)
 
     def read_bytes(self) -> bytes:
@@ -130,7 +172,15 @@ class LocalUpath(Upath, os.PathLike):
         Read the content of the current file as bytes.
         """
         try:
-            return self.path.read_bytes()
+            with open(self._path, "rb") as file:
+                return file.read()
+        except (IsADirectoryError, FileNotFoundError) as e:
+            raise FileNotFoundError(f"No such file: '{self}'") from e
+
+    def _read_into(self, file) -> None:
+        try:
+            with open(self._path, "rb") as src:
+                shutil.copyfileobj(src, file)
         except (IsADirectoryError, FileNotFoundError) as e:
             raise FileNotFoundError(f"No such file: '{self}'") from e
 
@@ -138,32 +188,176 @@ class LocalUpath(Upath, os.PathLike):
         """
         Write the bytes ``data`` to the current file.
         """
-        if self.is_file():
-            if not overwrite:
-                raise FileExistsError(f"File exists: '{self}'")
-        self.parent.path.mkdir(exist_ok=True, parents=True)
         try:
             memoryview(
                 data
             )  # bytes-like object, such as bytes, bytearray, array.array, memoryview
         except TypeError:
-            data = data.read()  # file-like object, like BytesIO, that is at beginning
-        self.path.write_bytes(data)
+            # File-like object, like BytesIO, that is at beginning.
+            # Copy it in chunks rather than reading all of it into memory.
+            if not hasattr(data, "read"):
+                raise TypeError(
+                    f"expected a bytes-like or file-like object, got {type(data).__name__}"
+                )
+            self._write_from_file(data, overwrite)
+            return
+
+        with self._open_for_write(overwrite) as file:
+            file.write(data)
 
         # If `self` is an existing directory, will raise `IsADirectoryError`.
         # If `self` is an existing file, will overwrite.
 
+    def _write_from_file(self, data, overwrite: bool) -> None:
+        # Reading `data` may fail partway, hence an existing file is not touched
+        # until all of `data` has been written to a temporary file next to it,
+        # and a new file is removed if it is not complete.
+        if not overwrite:
+            with self._open_for_write(False) as file:
+                try:
+                    shutil.copyfileobj(data, file)
+                except BaseException:
+                    file.close()
+                    os.unlink(self._path)
+                    raise
+            return
+
+        tmp = self.with_name(f".{self.name}.{uuid4().hex}.tmp")
+        try:
+            with tmp._open_for_write(False) as file:
+                shutil.copyfileobj(data, file)
+            with contextlib.suppress(FileNotFoundError):
+                shutil.copymode(self._path, tmp._path)
+            os.replace(tmp._path, self._path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp._path)
+            raise
+
+    def _open_for_write(self, overwrite: bool):
+        # Mode 'x' lets the OS check for an existing file in the same call
+        # that opens it, and parent dirs are created only if they are missing.
+        # This saves a few syscalls per file in bulk operations like `copy_dir`.
+        mode = "wb" if overwrite else "xb"
+        try:
+            try:
+                return open(self._path, mode)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                return open(self._path, mode)
+        except FileExistsError as e:
+            if self.is_dir():
+                raise IsADirectoryError(f"Is a directory: '{self}'") from e
+            raise FileExistsError(f"File exists: '{self}'") from e
+
+    def write_text(
+        self,
+        data: str,
+        *,
+        overwrite: bool = False,
+        encoding: str | None = None,
+        errors: str | None = None,
+    ) -> None:
+        """
+        Write text ``data`` to the current file.
+
+        Unless ``overwrite`` is ``True``, a large text is encoded and written
+        into the new file a chunk at a time, so that the encoded copy of the text
+        is never held in memory in its entirety. With ``overwrite=True``, the text
+        is encoded in full first, so that an existing file is not lost if encoding fails.
+        """
+        n = self._WRITE_TEXT_CHUNK_SIZE
+        if overwrite or len(data) <= n:
+            return super().write_text(
+                data, overwrite=overwrite, encoding=encoding, errors=errors
+            )
+        encoder = codecs.getincrementalencoder(encoding or "utf-8")(errors or "strict")
+        with self._open_for_write(False) as file:
+            try:
+                for i in range(0, len(data), n):
+                    file.write(encoder.encode(data[i : i + n]))
+                file.write(encoder.encode("", final=True))
+            except UnicodeError:
+                # The file did not exist before, hence remove the partial file.
+                file.close()
+                os.unlink(self._path)
+                raise
+
+    def write_pickle(self, data: Any, *, overwrite=False, **kwargs) -> None:
+        """
+        Pickle ``data`` into the current file.
+
+        Unless ``overwrite`` is ``True``, the pickle is written into the new file
+        a frame at a time, so that the pickled copy of a large object is never held
+        in memory in its entirety. With ``overwrite=True``, the pickle is built
+        in memory first, so that an existing file is not lost if pickling fails.
+        """
+        if overwrite:
+            return super().write_pickle(data, overwrite=overwrite, **kwargs)
+        protocol = kwargs.pop("protocol", None)
+        if protocol is None:
+            protocol = _serializer().PICKLE_PROTOCOL
+        with self._open_for_write(False) as file:
+            try:
+                pickle.dump(data, file, protocol=protocol, **kwargs)
+            except Exception:
+                # The file did not exist before, hence remove the partial file.
+                file.close()
+                os.unlink(self._path)
+                raise
+
     def _copy_file(
         self, source: LocalUpath, target: LocalUpath, *, overwrite: bool = False
     ):
         if not overwrite and target.is_file():
             raise FileExistsError(f"File exists: '{target}'")
-        os.makedirs(target.parent, exist_ok=True)
+        os.makedirs(os.path.dirname(target._path), exist_ok=True)
         # If `p` is a file and we try to `os.makedirs(p / 'subdir`)`,
         # on Linux it raises `NotADirectoryError`;
         # on Windows it raises `FileNotFoundError`.
-        shutil.copyfile(source.path, target.path)
+        try:
+            same = os.path.samefile(source._path, target._path)
+        except OSError:
+            same = False
+        if same:
+            # Check this before opening the target for writing, which would
+            # truncate the source if the target is, say, a symlink to it.
+            raise shutil.SameFileError(f"'{source}' and '{target}' are the same file")
+        if LocalUpath._CLONE_FILES and self._clone_file(source._path, target._path):
+            return
+        shutil.copyfile(source._path, target._path)
         # If target already exists, it will be overwritten.
+        # On Linux, this copies within the kernel by `os.sendfile`.
+
+    @staticmethod
+    def _clone_file(source: str, target: str) -> bool:
+        # On file systems that support it, such as Btrfs and XFS, the target
+        # shares the data blocks of the source (copy-on-write), so no data is copied.
+        # Return whether this succeeded; if not, the caller copies the data.
+        # Only a new target is cloned; an existing target is left untouched
+        # for the caller to overwrite.
+        import fcntl
+
+        with open(source, "rb") as src:
+            # Cloning works only within one file system, hence the source tells.
+            dev = os.fstat(src.fileno()).st_dev
+            if dev in _NO_CLONE_DEVICES:
+                return False
+            try:
+                dst = open(target, "xb")
+            except FileExistsError:
+                return False
+            with dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                    return True
+                except OSError as e:
+                    if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL):
+                        # The file system does not support cloning (e.g. ext4).
+                        # Do not try again on it in this process.
+                        _NO_CLONE_DEVICES.add(dev)
+        os.unlink(target)
+        return False
 
     def copy_file(self, source: str | Upath, *, overwrite: bool = False) -> None:
         if is_local_path(source):
@@ -204,14 +398,15 @@ class LocalUpath(Upath, os.PathLike):
         Remove the current dir along with all its contents recursively.
         """
         n = super().remove_dir(**kwargs)
-        if self.path.is_dir():
-            shutil.rmtree(self.path)
+        # Remove the dirs left behind.
+        if os.path.isdir(self._path):
+            shutil.rmtree(self._path)
         return n
 
     def remove_file(self) -> None:
         """Remove the current file."""
         try:
-            self.path.unlink()
+            os.unlink(self._path)
         except PermissionError as e:  # this happens on Windows if `self` is a dir.
             if self.is_dir():
                 raise IsADirectoryError(f"Is a directory: '{self}'") from e
@@ -219,6 +414,64 @@ class LocalUpath(Upath, os.PathLike):
                 raise
         # On Linux, if `self` is a dir, `IsADirectoryError` will be raised.
 
+    @staticmethod
+    def _remove_file_at(path: str) -> None:
+        # The paths come from `riterdir_paths`, hence are files,
+        # and none of the checks in `remove_file` is needed.
+        os.unlink(path)
+
+    def rmrf(
+        self, *, quiet: bool = True, concurrent: bool = False, count: bool = True
+    ) -> int | None:
+        """
+        Remove the current file or dir (i.e. ``self``) recursively.
+
+        A dir tree is removed in one go by ``shutil.rmtree``,
+        which walks the tree by file descriptors like ``rm -rf`` does,
+        rather than by :meth:`remove_file` on every file.
+        Symlinks inside the tree are removed, not followed.
+
+        Return the number of files removed. If ``count`` is ``False``, return ``None``
+        and skip the walk that counts the files.
+        """
+        if concurrent:
+            return super().rmrf(quiet=quiet, concurrent=concurrent, count=count)
+        path = self._path
+        # One `lstat` tells what to do, instead of trying `remove_file` first
+        # and falling back to `remove_dir` on failure.
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return 0 if count else None
+        if not stat.S_ISDIR(st.st_mode):
+            # A file, or a symlink (to a file or a dir).
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                return 0 if count else None
+            return 1 if count else None
+        if path == "/":
+            raise UnsupportedOperation("`rmrf` not allowed on root directory")
+        n = None
+        if count:
+            # Count what `shutil.rmtree` will remove: it does not descend into
+            # a symlink to a dir, but removes the link, like any other non-dir entry.
+            # (`riterdir_paths` follows symlinks, hence is not used here.)
+            n = 0
+            dirs = [path]
+            while dirs:
+                try:
+                    with os.scandir(dirs.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                dirs.append(entry.path)
+                            else:
+                                n += 1
+                except (NotADirectoryError, FileNotFoundError):
+                    continue
+        shutil.rmtree(path)
+        return n
+
     def rename_dir(
         self,
         target: str | LocalUpath,
@@ -279,7 +532,7 @@ class LocalUpath(Upath, os.PathLike):
         if not overwrite and target.is_file():
             raise FileExistsError(f"File exists: '{target}'")
         os.makedirs(target.parent, exist_ok=True)
-        self.path.rename(target.path)
+        os.rename(self._path, target._path)
 
     def rename_file(
         self, target: str | LocalUpath, *, overwrite: bool = False
@@ -304,25 +557,81 @@ class LocalUpath(Upath, os.PathLike):
         self._rename_file(target_._path, overwrite=overwrite)
         return target_
 
+    def _scandir(self) -> Iterator[os.DirEntry]:
+        try:
+            with os.scandir(self._path) as entries:
+                yield from entries
+        except (NotADirectoryError, FileNotFoundError):
+            pass
+
     def iterdir(self) -> Iterator[LocalUpath]:
         """
         Yield the immediate children under the current dir.
         """
-        try:
-            for p in self.path.iterdir():
-                yield self / p.name
-        except (NotADirectoryError, FileNotFoundError):
-            pass
+        # `entry.path` is `self._path` joined with a plain name, hence already normalized.
+        for entry in self._scandir():
+            yield self._with_normalized_path(entry.path)
 
     def riterdir(self) -> Iterator[LocalUpath]:
         """
         Yield all files under the current dir recursively.
         """
-        for p in self.iterdir():
-            if p.is_file():
-                yield p
-            elif p.is_dir():
-                yield from p.riterdir()
+        # The paths from `os.scandir` are `self._path` joined with plain names,
+        # hence already normalized.
+        make = self._with_normalized_path
+        for path in self.riterdir_paths():
+            yield make(path)
+
+    def iterdir_depth(self, max_depth: int) -> Iterator[LocalUpath]:
+        """
+        Yield files under the current dir down to ``max_depth`` levels.
+        """
+        if max_depth < 1:
+            raise ValueError(f"`max_depth` must be positive; got {max_depth}")
+        # Same walk as in `riterdir_paths`, except that a dir is not
+        # pushed once it is at `max_depth`.
+        make = self._with_normalized_path
+        dirs = [(self._path, 1)]
+        while dirs:
+            path, depth = dirs.pop()
+            files = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            files.append(entry.path)
+                        elif depth < max_depth and entry.is_dir():
+                            dirs.append((entry.path, depth + 1))
+            except (NotADirectoryError, FileNotFoundError):
+                continue
+            for path in files:
+                yield make(path)
+
+    def riterdir_paths(self) -> Iterator[str]:
+        """
+        Yield the paths of all files under the current dir recursively.
+        """
+        # Walk with an explicit stack of dirs rather than recursive generators.
+        # The type of each entry comes from `os.scandir` without another `stat`.
+        # (On POSIX, `entry.is_file()` and `entry.is_dir()` use the file type
+        # returned by `readdir`, whereas `entry.stat()` would make a syscall.)
+        # Each dir is fully listed before its files are yielded, because the
+        # caller may be removing or renaming the files as they come.
+        dirs = [self._path]
+        push_dir = dirs.append
+        while dirs:
+            files = []
+            add_file = files.append
+            try:
+                with os.scandir(dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            add_file(entry.path)
+                        elif entry.is_dir():
+                            push_dir(entry.path)
+            except (NotADirectoryError, FileNotFoundError):
+                continue
+            yield from files
 
     @contextlib.contextmanager
     def lock(self, *, timeout=None):
@@ -333,16 +642,42 @@ class LocalUpath(Upath, os.PathLike):
         .. note:: At the end, this file is not deleted. If it is purely a dummy file to implement locking
           for other things, user may want to delete this file after use.
         """
+        # `filelock` is also called `py-filelock`.
+        # Tried `fasteners` also. In one use case,
+        # `filelock` worked whereas `fasteners.InterprocessLock` failed.
+        #
+        # Other options to look into include
+        # `oslo.concurrency`, `pylocker`, `portalocker`.
+        #
+        # It is imported here because it is slow to import and is needed only here.
+        import filelock
+
         if timeout is None:
             timeout = 60
-        os.makedirs(self.parent, exist_ok=True)
-        lockfile = self.with_suffix(self.suffix + ".lock")
+        lockfile = self._lock_file()
         lock = filelock.FileLock(str(lockfile))  # this object manages re-entry itself
+
+        def try_acquire():
+            try:
+                try:
+                    lock.acquire(timeout=0)
+                except FileNotFoundError:
+                    # Create the parent dir only when it is missing, so that
+                    # the usual, uncontended case costs a single attempt.
+                    os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                    lock.acquire(timeout=0)
+            except filelock.Timeout:
+                return False
+            return True
+
         t0 = time.perf_counter()
         try:
-            lock.acquire(
-                timeout=timeout, poll_interval=self._LOCK_POLL_INTERVAL_SECONDS
-            )
+            if not self._acquire_with_backoff(
+                try_acquire,
+                timeout=timeout,
+                maximum=self._LOCK_POLL_INTERVAL_SECONDS,
+            ):
+                raise filelock.Timeout(str(lockfile))
         except Exception as e:
             raise LockAcquireError(
                 f"Failed to lock '{self}' trying for {time.perf_counter() - t0:.2f} seconds; gave up on {e!r}"
@@ -15,15 +15,18 @@ from __future__ import annotations
 # https://stackoverflow.com/a/49872353
 # Will no longer be needed in Python 3.10.
 import abc
+import concurrent.futures
 import contextlib
 import datetime
-import functools
+import itertools
+import operator
 import os
 import os.path
 import pathlib
-import queue
+import random
 import sys
-import threading
+import tempfile
+import time
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from io import BufferedReader, UnsupportedOperation
@@ -33,21 +36,55 @@ from typing import (
     Union,
 )
 
-from tqdm.auto import tqdm
 from typing_extensions import Self
 
 from ._util import MAX_THREADS, get_shared_thread_pool
-from .serializer import (
-    JsonSerializer,
-    PickleSerializer,
-    ZstdPickleSerializer,
-)
+
+# `tqdm` and `.serializer` are imported where they are used, because they take
+# a good part of the time to import this package, while many users never need them.
+
+_serializer_module = None
+
+
+def _serializer():
+    # Import `.serializer` on first use and keep a reference to it,
+    # because an import statement in a method costs about a microsecond per call.
+    global _serializer_module
+    if _serializer_module is None:
+        from . import serializer
+
+        _serializer_module = serializer
+    return _serializer_module
+
 
 # End user may want to do this:
 #  logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
 # to suppress the "urllib3 connection lost" warning.
 
 
+def _normpath(*segments: str) -> str:
+    # Equivalent to `os.path.normpath(os.path.join("/", *segments))`.
+    # A single segment that needs no more than a leading '/' added and
+    # a trailing '/' removed, e.g. a path joined with a plain name, is handled
+    # by string checks, because the join and `normpath` are costly when
+    # creating many paths.
+    if len(segments) == 1 and os.sep == "/":
+        path = segments[0]
+        if path.__class__ is str and path:
+            if path[0] != "/":
+                path = "/" + path
+            if "//" not in path and "/./" not in path and "/../" not in path:
+                if path[-1] == "/" and len(path) > 1:
+                    path = path[:-1]
+                if not path.endswith(("/.", "/..")):
+                    return path
+    return os.path.normpath(os.path.join("/", *segments))
+
+
+_PATH_KEY = operator.attrgetter("_path")
+# Sort key for paths that share the same store, e.g. the children of one dir.
+
+
 class LockAcquireError(TimeoutError):
     pass
 
@@ -56,7 +93,11 @@ class LockReleaseError(RuntimeError):
     pass
 
 
-@dataclass
+class StaleReadError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
 class FileInfo:
     ctime: float  #: Creation time as a POSIX timestamp.
     mtime: float  #: Last modification time as a POSIX timestamp.
@@ -68,8 +109,38 @@ class FileInfo:
     details: Any  #: Platform-dependent.
 
 
-@functools.total_ordering
 class Upath(abc.ABC):
+    __slots__ = (
+        "_path",
+        "_parent_str",
+        "_name",
+        "_path_obj",
+        "_lock_file_",
+        "__weakref__",
+    )
+    # Subclasses that do not declare `__slots__` still get a `__dict__`
+    # for their own attributes; the slots make access to the core attributes faster.
+
+    _REMOVE_DIR_BATCH_SIZE: int = 1
+    # Number of files removed by one call to :meth:`_remove_files_at` in :meth:`remove_dir`.
+    # Removing a blob is a network call, so the default keeps one file per task
+    # for maximum concurrency. A subclass whose removal is cheap, or that removes
+    # a batch by a single request, may use a larger value.
+
+    _DIR_TO_DIR_BATCH_SIZE: int = 1
+    # Number of files copied or renamed by one task in a concurrent :meth:`copy_dir`
+    # or :meth:`rename_dir`. The smaller of the values on the source and the target
+    # is used, so that e.g. downloads from a blob store stay one file per task.
+
+    _COPY_FILE_SPOOL_SIZE: int = 64 * 1024 * 1024
+    # In :meth:`_copy_file` between different kinds of storage, a file up to
+    # this size (in bytes) is held in memory; a larger one is spooled to a temporary file.
+
+    _INTERN_PATHS: bool = False
+    # If ``True``, path strings longer than 32 characters are interned by ``sys.intern``,
+    # so that a path held in several collections (e.g. a listing, a dedup set, a cache)
+    # is stored once. This may save memory when millions of paths are retained.
+
     def __init__(
         self,
         *pathsegments: str,
@@ -111,19 +182,36 @@ class Upath(abc.ABC):
                 Google Cloud Storage. Please see subclasses for specifics.
         """
 
-        self._path = os.path.normpath(os.path.join("/", *pathsegments))  # pylint: disable=no-value-for-parameter
+        path = _normpath(*pathsegments)
+        if self._INTERN_PATHS and len(path) > 32:
+            path = sys.intern(path)
+        self._path = path
         # For LocalUpath on Windows, this is like 'C:\\Users\\username\\path'.
         # For LocalUpath on Linux, and BlobUpath, this is always absolute starting with '/'.
         # It does not have a trailing `/` unless the path is just `/` itself.
-        self._thread_pools = {}
+        self._parent_str = None
+        self._name = None
+        self._path_obj = None
+        self._lock_file_ = None
 
     def __getstate__(self):
-        # Do not pickle `self._thread_pools`.
         return (self._path,)
 
     def __setstate__(self, data):
-        self._path = data[0]
-        self._thread_pools = {}
+        path = data[0]
+        if self._INTERN_PATHS and len(path) > 32:
+            path = sys.intern(path)
+        self._path = path
+        self._parent_str = None
+        self._name = None
+        self._path_obj = None
+        self._lock_file_ = None
+
+    def _split_path(self) -> None:
+        # `self._path` is normalized and absolute, hence a single split
+        # gives the parent and the name; no `PurePath` is involved.
+        # The result is cached because paths are effectively immutable.
+        self._parent_str, self._name = os.path.split(self._path)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self._path}')"
@@ -136,95 +224,162 @@ class Upath(abc.ABC):
     def __eq__(self, other) -> bool:
         if other.__class__ is not self.__class__:
             return NotImplemented
-        return self.as_uri() == other.as_uri()
+        # Compare the path strings first, which settles most cases
+        # without building the URIs.
+        return self._path == other._path and self.as_uri() == other.as_uri()
+
+    # The ordering methods are spelled out rather than generated by
+    # `functools.total_ordering`, whose methods call both `__lt__` and `__eq__`.
 
     def __lt__(self, other) -> bool:
         if other.__class__ is not self.__class__:
             return NotImplemented
         return self.as_uri() < other.as_uri()
 
+    def __le__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_uri() <= other.as_uri()
+
+    def __gt__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_uri() > other.as_uri()
+
+    def __ge__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_uri() >= other.as_uri()
+
     def __hash__(self) -> int:
-        return hash(self.as_uri())
+        # Equal objects have equal path strings, hence equal hashes.
+        # Paths in different buckets of a blob store may have the same hash,
+        # which is fine. The hash of a `str` is cached on the object.
+        return hash(self._path)
 
     def __truediv__(self, key: str) -> Self:
         """
         This method is invoked by ``self / key``.
         This calls the method :meth:`joinpath`.
         """
+        if (
+            key.__class__ is str
+            and key not in ("", ".", "..")
+            and "/" not in key
+            and os.sep == "/"
+        ):
+            # A plain name, by far the most common case, makes a normalized path
+            # by concatenation.
+            path = self._path
+            return self._with_normalized_path((path if path != "/" else "") + "/" + key)
         return self.joinpath(key)
 
     def _run_in_executor(
         self,
         tasks: Iterable[tuple[Callable, tuple, dict, str]],
         quiet: bool,
+        *,
+        counts: bool = False,
     ):
         """
         This method is used to run multiple I/O jobs concurrently, e.g.
         uploading/downloading all files in a folder recursively.
 
+        The jobs run in a thread pool rather than an ``asyncio`` event loop,
+        because the jobs are methods of the path classes, which make blocking calls
+        to the file system or to the synchronous clients of the cloud SDKs.
+        With an event loop, these calls would still have to be handed over to threads.
+
+        A long job, e.g. copying a huge file, occupies one worker while the other
+        workers keep taking new jobs, because the results are collected in the order
+        of completion. A subclass may further split a large file into chunks that are
+        handled in its own thread pool, as :class:`GcsBlobUpath` does for downloads.
+
         Parameters
         ----------
         tasks
             Each element is a tuple of (func, args, kwargs, description).
+
+            If this is not a list, it is consumed lazily as the jobs are submitted,
+            hence it is not materialized in memory (e.g. the output of
+            :meth:`riterdir` on a huge dir); in that case the progress bar
+            shows a count without a total.
+        counts
+            If ``True``, each job returns the number of items (e.g. files) it has
+            processed, and the progress bar counts the items rather than the jobs.
         """
-        if not isinstance(tasks, list):
-            tasks = list(tasks)
-        n_tasks = len(tasks)
-        if not n_tasks:
-            return
+        if isinstance(tasks, list):
+            n_tasks = len(tasks)
+            if not n_tasks:
+                return
+        else:
+            n_tasks = None
 
         pbar = None
         executor = get_shared_thread_pool("upathlib", MAX_THREADS)
 
         if not quiet:
-            pbar = tqdm(
-                total=n_tasks,
-                bar_format="{percentage:5.1f}%, {n:.0f}/{total_fmt}, {elapsed} | {desc}",
-            )
-
-        def enqueue(tasks, executor, q, to_stop):
-            for func, args, kwargs, desc in tasks:
-                t = executor.submit(func, *args, **kwargs)
-                # This has limited capacity, to control the speed of
-                # task submission to the executor.
-                q.put((t, desc))
-                if to_stop.is_set():
-                    break
-            q.put(None)
+            from tqdm.auto import tqdm
+
+            if n_tasks is None:
+                pbar = tqdm(bar_format="{n:.0f}, {elapsed}, {rate_fmt} | {desc}")
+            else:
+                pbar = tqdm(
+                    total=n_tasks,
+                    bar_format="{percentage:5.1f}%, {n:.0f}/{total_fmt}, {elapsed} | {desc}",
+                )
+
+        # At most this many tasks are submitted but not yet finished,
+        # to control the speed of consuming `tasks`.
+        window = executor._max_workers + 4
+        tasks = iter(tasks)
+        pending = {}
+
+        def submit(n):
+            for func, args, kwargs, desc in itertools.islice(tasks, n):
+                pending[executor.submit(func, *args, **kwargs)] = desc
+
+        # The progress bar takes a lock on every update, hence it is updated
+        # at most once per `pbar_interval` seconds rather than once per task.
+        pbar_interval = 0.1
+        pbar_time = time.monotonic()
+        n_done = 0  # number of finished tasks not yet counted in the progress bar
 
         try:
-            q = queue.Queue(executor._max_workers)
-            to_stop = threading.Event()
-            task = executor.submit(enqueue, tasks, executor, q, to_stop)
-
-            try:
-                while True:
-                    z = q.get()
-                    if z is None:
-                        break
-                    t, desc = z
-                    if pbar:
-                        pbar.set_description_str(desc)
-                        pbar.update(0.5)
-                    try:
-                        yield t.result()
-                    except Exception:
-                        to_stop.set()
-                        while True:
-                            z = q.get()
-                            if z is None:
-                                break
-                            t, desc = z
-                            t.cancel()
-                            # This may not succeed, but there isn't a good way to
-                            # guarantee cancellation here.
-                        raise
-                    if pbar:
-                        pbar.update(0.5)
-            finally:
-                _ = task.result()
+            submit(window)
+            # Results are yielded in the order of completion, so that a slow task
+            # does not hold up the ones that have finished after it.
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                k = len(done)
+                # Take the futures out of `done` one by one, so that a result
+                # (e.g. the bytes of a file) is not kept alive after it is consumed
+                # while the rest of `done` is being yielded.
+                while done:
+                    t = done.pop()
+                    desc = pending.pop(t)
+                    z = t.result()
+                    n_done += z if counts else 1
+                    yield z
+                t = z = None
+                if pbar is not None:
+                    now = time.monotonic()
+                    if now - pbar_time >= pbar_interval:
+                        pbar.set_description_str(desc, refresh=False)
+                        pbar.update(n_done)
+                        n_done = 0
+                        pbar_time = now
+                submit(k)
         finally:
-            if pbar:
+            # In case of an exception, cancel the tasks that have not started.
+            for t in pending:
+                t.cancel()
+            if pbar is not None:
+                if n_done:
+                    pbar.set_description_str(desc, refresh=False)
+                    pbar.update(n_done)
                 pbar.close()
 
     @property
@@ -239,8 +394,13 @@ class Upath(abc.ABC):
         `pathlib.PurePath <https://docs.python.org/3/library/pathlib.html#pathlib.PurePath>`_.
 
         In subclasses for cloud blob stores, this implementation stays in effect.
+
+        The object is created on first access and cached.
         """
-        return pathlib.PurePath(self._path)
+        p = self._path_obj
+        if p is None:
+            p = self._path_obj = pathlib.PurePath(self._path)
+        return p
 
     @abc.abstractmethod
     def as_uri(self) -> str:
@@ -279,7 +439,9 @@ class Upath(abc.ABC):
         >>> p.parent.parent.parent.parent.parent.parent
         LocalUpath('/')
         """
-        return self.path.name
+        if self._name is None:
+            self._split_path()
+        return self._name
 
     @property
     def stem(self) -> str:
@@ -304,14 +466,22 @@ class Upath(abc.ABC):
         >>> p.stem
         'sales.txt'
         """
-        return self.path.stem
+        name = self.name
+        i = name.rfind(".")
+        if 0 < i < len(name) - 1:
+            return name[:i]
+        return name
 
     @property
     def suffix(self) -> str:
         """
         The file extension of the final component, if any
         """
-        return self.path.suffix
+        name = self.name
+        i = name.rfind(".")
+        if 0 < i < len(name) - 1:
+            return name[i:]
+        return ""
 
     @property
     def suffixes(self) -> list[str]:
@@ -331,7 +501,11 @@ class Upath(abc.ABC):
         >>> p.suffixes
         ['.txt', '.gz']
         """
-        return self.path.suffixes
+        # Same rules as `pathlib.PurePath.suffixes`.
+        name = self.name
+        if name.endswith("."):
+            return []
+        return ["." + s for s in name.lstrip(".").split(".")[1:]]
 
     def exists(self) -> bool:
         """Return ``True`` if the path is an existing file or dir;
@@ -415,7 +589,9 @@ class Upath(abc.ABC):
 
         If the path is the root, then the parent is still the root.
         """
-        return self._with_path(str(self.path.parent))
+        if self._parent_str is None:
+            self._split_path()
+        return self._with_normalized_path(self._parent_str)
 
     @property
     @abc.abstractmethod
@@ -435,9 +611,22 @@ class Upath(abc.ABC):
         For example, return a new path in the same store with the same
         account and bucket info.
         """
+        return self._with_normalized_path(_normpath(*paths))
+
+    def _with_normalized_path(self, path: str) -> Self:
+        """
+        Like :meth:`_with_path`, but ``path`` is a single string that is
+        already normalized, hence is used as is.
+        """
         # TODO: the implementation is a little hacky.
         r = self.root
-        r._path = os.path.normpath(os.path.join("/", *paths))
+        if r._INTERN_PATHS and len(path) > 32:
+            path = sys.intern(path)
+        r._path = path
+        r._parent_str = None
+        r._name = None
+        r._path_obj = None
+        r._lock_file_ = None
         return r
 
     def joinpath(self, *other: str) -> Self:
@@ -452,6 +641,15 @@ class Upath(abc.ABC):
         If ``*other`` is a single string, there is a shortcut by the operator
         ``/``, implemented by :meth:`__truediv__`.
         """
+        if os.sep == "/" and all(
+            s.__class__ is str and s and s[0] != "/" for s in other
+        ):
+            # No segment resets to the root, hence the join is a plain concatenation,
+            # which `_normpath` checks and normalizes.
+            path = self._path
+            return self._with_path(
+                (path if path != "/" else "") + "/" + "/".join(other)
+            )
         return self._with_path(os.path.join(self._path, *other))
 
     def with_name(self, name: str) -> Self:
@@ -466,10 +664,24 @@ class Upath(abc.ABC):
         >>> p.with_name('sales.data')
         LocalUpath('/tmp/test/upathlib/data/sales.data')
         """
-        return self._with_path(str(self.path.with_name(name)))
+        if not self.name:
+            raise ValueError(f"{self!r} has an empty name")
+        if (
+            not name
+            or name == "."
+            or os.sep in name
+            or (os.altsep and os.altsep in name)
+        ):
+            raise ValueError(f"Invalid name {name!r}")
+        if name == "..":
+            return self._with_path(self._parent_str, name)
+        r = self._with_normalized_path(os.path.join(self._parent_str, name))
+        r._parent_str = self._parent_str
+        r._name = name
+        return r
 
     def with_stem(self, stem: str) -> Self:
-        return self._with_path(str(self.path.with_stem(stem)))
+        return self.with_name(stem + self.suffix)
 
     def with_suffix(self, suffix: str) -> Self:
         """
@@ -506,7 +718,14 @@ class Upath(abc.ABC):
         >>> pp.with_suffix('.pickle')
         LocalUpath('/tmp/test/upathlib/data/sales.pickle')
         """
-        return self._with_path(str(self.path.with_suffix(suffix)))
+        if (
+            os.sep in suffix
+            or (os.altsep and os.altsep in suffix)
+            or (suffix and not suffix.startswith("."))
+            or suffix == "."
+        ):
+            raise ValueError(f"Invalid suffix {suffix!r}")
+        return self.with_name(self.stem + suffix)
 
     @abc.abstractmethod
     def write_bytes(
@@ -551,8 +770,10 @@ class Upath(abc.ABC):
         ``encoding`` and ``errors`` are passed to `encode() <https://docs.python.org/3/library/stdtypes.html#str.encode>`_.
         Usually you should leave them at the default values.
         """
-        z = data.encode(encoding=encoding or "utf-8", errors=errors or "strict")
-        self.write_bytes(z, overwrite=overwrite)
+        self.write_bytes(
+            data.encode(encoding=encoding or "utf-8", errors=errors or "strict"),
+            overwrite=overwrite,
+        )
 
     def read_text(
         self, *, encoding: str | None = None, errors: str | None = None
@@ -573,22 +794,28 @@ class Upath(abc.ABC):
         )
 
     def write_json(self, data: Any, *, overwrite=False, **kwargs) -> None:
-        return JsonSerializer.dump(data, self, overwrite=overwrite, **kwargs)
+        return _serializer().JsonSerializer.dump(
+            data, self, overwrite=overwrite, **kwargs
+        )
 
     def read_json(self, **kwargs) -> Any:
-        return JsonSerializer.load(self, **kwargs)
+        return _serializer().JsonSerializer.load(self, **kwargs)
 
     def write_pickle(self, data: Any, *, overwrite=False, **kwargs) -> None:
-        return PickleSerializer.dump(data, self, overwrite=overwrite, **kwargs)
+        return _serializer().PickleSerializer.dump(
+            data, self, overwrite=overwrite, **kwargs
+        )
 
     def read_pickle(self, **kwargs) -> Any:
-        return PickleSerializer.load(self, **kwargs)
+        return _serializer().PickleSerializer.load(self, **kwargs)
 
     def write_pickle_zstd(self, data: Any, *, overwrite=False, **kwargs) -> None:
-        return ZstdPickleSerializer.dump(data, self, overwrite=overwrite, **kwargs)
+        return _serializer().ZstdPickleSerializer.dump(
+            data, self, overwrite=overwrite, **kwargs
+        )
 
     def read_pickle_zstd(self, **kwargs) -> Any:
-        return ZstdPickleSerializer.load(self, **kwargs)
+        return _serializer().ZstdPickleSerializer.load(self, **kwargs)
 
     def _dir_to_dir(
         self,
@@ -602,34 +829,62 @@ class Upath(abc.ABC):
         concurrent: bool = True,
     ) -> int:
         def foo():
-            source_path = source.path
-            ovwt = overwrite
-            for p in source.riterdir():
-                extra = str(p.path.relative_to(source_path))
-                if method_on_source:
-                    yield (
-                        getattr(p, method),
-                        (target / extra,),
-                        {"overwrite": ovwt},
-                        extra,
-                    )
-                else:
-                    yield (
-                        getattr(target / extra, method),
-                        (p,),
-                        {"overwrite": ovwt},
-                        extra,
-                    )
+            prefix = source._path.rstrip(os.sep) + os.sep
+            nprefix = len(prefix)
+            if os.sep == "/":
+                # `extra` is a normalized relative path, hence the target path
+                # is a plain concatenation and needs no normalization.
+                tprefix = target._path.rstrip("/") + "/"
+                make = target._with_normalized_path
+
+                def target_of(extra):
+                    return make(tprefix + extra)
+            else:
+                target_of = target.joinpath
+            kwargs = {"overwrite": overwrite}
+            # Look up the method once on the class rather than binding it
+            # on a new object for every file; the object is passed in as `self`.
+            if method_on_source:
+                func = getattr(source.__class__, method)
+                for p in source.riterdir():
+                    extra = p._path[nprefix:]
+                    yield func, (p, target_of(extra)), kwargs, extra
+            else:
+                func = getattr(target.__class__, method)
+                for p in source.riterdir():
+                    extra = p._path[nprefix:]
+                    yield func, (target_of(extra), p), kwargs, extra
 
         n = 0
-        if concurrent:
-            for _ in self._run_in_executor(foo(), quiet):
-                n += 1
-        else:
+        if not concurrent:
             for f, args, kwargs, _ in foo():
                 f(*args, **kwargs)
                 n += 1
-        return n
+            return n
+
+        batch_size = min(source._DIR_TO_DIR_BATCH_SIZE, target._DIR_TO_DIR_BATCH_SIZE)
+        if batch_size == 1:
+            for _ in self._run_in_executor(foo(), quiet):
+                n += 1
+            return n
+
+        def _run_batch(batch):
+            for f, args, kwargs, _ in batch:
+                f(*args, **kwargs)
+            return len(batch)
+
+        def batches():
+            # Group the files into batches, just like in `remove_dir`.
+            batch = []
+            for task in foo():
+                batch.append(task)
+                if len(batch) >= batch_size:
+                    yield _run_batch, (batch,), {}, task[3]
+                    batch = []
+            if batch:
+                yield _run_batch, (batch,), {}, batch[-1][3]
+
+        return sum(self._run_in_executor(batches(), quiet, counts=True))
 
     def copy_dir(
         self,
@@ -682,8 +937,36 @@ class Upath(abc.ABC):
             concurrent=concurrent,
         )
 
+    def _read_into(self, file) -> None:
+        """
+        Write the content of the current file into ``file``, which is "file-like"
+        open in "binary" mode for writing.
+
+        If ``self`` is not a file or does not exist,
+        ``FileNotFoundError`` is raised.
+
+        This default implementation goes through :meth:`read_bytes`.
+        A subclass may override this to stream the content in chunks.
+        """
+        file.write(self.read_bytes())
+
     def _copy_file(self, source: Upath, target: Upath, *, overwrite: bool = False):
-        target.write_bytes(source.read_bytes(), overwrite=overwrite)
+        if source.__class__._read_into is Upath._read_into:
+            target.write_bytes(source.read_bytes(), overwrite=overwrite)
+            return
+        # The content goes through a temporary file, which is kept in memory
+        # while it is small and moved to disk once it gets large,
+        # so that copying a large file does not hold all of it in memory.
+        spool_size = self._COPY_FILE_SPOOL_SIZE
+        with tempfile.SpooledTemporaryFile(max_size=spool_size) as file:
+            source._read_into(file)
+            if not file._rolled:
+                # `getvalue` hands out the in-memory buffer itself,
+                # whereas `read` would make a second copy of the content.
+                target.write_bytes(file._file.getvalue(), overwrite=overwrite)
+            else:
+                file.seek(0)
+                target.write_bytes(file, overwrite=overwrite)
 
     def copy_file(self, source: str | Upath, *, overwrite: bool = False) -> None:
         """Copy the ``source`` file to the current file (i.e. ``self``).
@@ -737,19 +1020,27 @@ class Upath(abc.ABC):
             The number of files removed.
         """
 
-        def foo():
-            for p in self.riterdir():
-                yield p.remove_file, [], {}, str(p.path.relative_to(self.path))
+        nprefix = len(self._path.rstrip(os.sep) + os.sep)
+        remove = self._remove_files_at
 
-        n = 0
-        if concurrent:
-            for _ in self._run_in_executor(foo(), quiet):
-                n += 1
-        else:
-            for f, *_ in foo():
-                f()
-                n += 1
-        return n
+        def foo():
+            # Group files into batches so that cheap removals (e.g. on a local disk)
+            # are not dominated by the per-task overhead of the thread pool,
+            # and a subclass may remove a batch by a single request.
+            # Work on the path strings, so that a batch waiting to run is light.
+            batch_size = self._REMOVE_DIR_BATCH_SIZE
+            batch = []
+            for path in self.riterdir_paths():
+                batch.append(path)
+                if len(batch) >= batch_size:
+                    yield remove, (batch,), {}, path[nprefix:]
+                    batch = []
+            if batch:
+                yield remove, (batch,), {}, batch[-1][nprefix:]
+
+        if not concurrent:
+            return sum(f(*args) for f, args, _, _ in foo())
+        return sum(self._run_in_executor(foo(), quiet, counts=True))
 
     @abc.abstractmethod
     def remove_file(self) -> None:
@@ -761,6 +1052,30 @@ class Upath(abc.ABC):
         """
         raise NotImplementedError
 
+    def _remove_file_at(self, path: str) -> None:
+        """
+        Remove the file at ``path``, a string yielded by :meth:`riterdir_paths`.
+        This is used by :meth:`remove_dir` on every file.
+
+        The default implementation calls :meth:`remove_file` on a path object
+        created for ``path``. A subclass may remove the file without creating the object.
+        """
+        self._with_normalized_path(path).remove_file()
+
+    def _remove_files_at(self, paths: list[str]) -> int:
+        """
+        Remove the files at ``paths``, a batch of up to ``_REMOVE_DIR_BATCH_SIZE``
+        strings yielded by :meth:`riterdir_paths`, and return the number of files removed.
+        This is used by :meth:`remove_dir`.
+
+        The default implementation calls :meth:`_remove_file_at` on every path.
+        A subclass for a storage system that can remove many files by one request
+        may override this.
+        """
+        for path in paths:
+            self._remove_file_at(path)
+        return len(paths)
+
     @abc.abstractmethod
     def iterdir(self) -> Iterator[Self]:
         """Yield the immediate (i.e. non-recursive) children
@@ -784,8 +1099,15 @@ class Upath(abc.ABC):
         Sorting is by a full path string maintained internally.
 
         The returned list may be empty.
+
+        Because the result is sorted, the entire listing is held in memory
+        before anything is returned. For a huge dir where order does not matter,
+        iterate over :meth:`iterdir` instead, which streams the elements.
         """
-        return sorted(self.iterdir())
+        # All the elements are in the same store as `self`, hence their URIs
+        # differ only in the path part. Sorting on `_path` directly lets the sort
+        # compare plain strings, without calling a Python method per element.
+        return sorted(self.iterdir(), key=_PATH_KEY)
 
     @abc.abstractmethod
     def riterdir(self) -> Iterator[Self]:
@@ -803,15 +1125,64 @@ class Upath(abc.ABC):
         then nothing is yielded, and no exception is raised either.
 
         There is no guarantee on the order of the returned elements.
+
+        .. seealso:: :meth:`riterdir_paths`.
         """
         raise NotImplementedError
 
-    def rmrf(self, *, quiet: bool = True, concurrent: bool = False) -> int:
+    def iterdir_depth(self, max_depth: int) -> Iterator[Self]:
+        """Yield files under the current dir (i.e. ``self``) down to ``max_depth`` levels.
+
+        With ``max_depth=1``, this yields the files among the immediate children,
+        that is, the files yielded by :meth:`iterdir`. With ``max_depth=2``,
+        files in the immediate subdirectories are yielded as well, and so on.
+        Like :meth:`riterdir`, only files are yielded, and nothing is yielded
+        if ``self`` is not a dir or does not exist.
+
+        Use this instead of :meth:`riterdir` when the files deep down the tree
+        are not needed, so that they are not listed at all.
+
+        There is no guarantee on the order of the returned elements.
+
+        This default implementation calls :meth:`iterdir` on every dir visited,
+        and :meth:`is_file` and :meth:`is_dir` on every child.
+        Subclasses may have more efficient ways.
+        """
+        if max_depth < 1:
+            raise ValueError(f"`max_depth` must be positive; got {max_depth}")
+        dirs = [(self, 1)]
+        while dirs:
+            d, depth = dirs.pop()
+            for p in d.iterdir():
+                if p.is_file():
+                    yield p
+                elif depth < max_depth and p.is_dir():
+                    dirs.append((p, depth + 1))
+
+    def riterdir_paths(self) -> Iterator[str]:
+        """Yield the same files as :meth:`riterdir`, but as full path strings
+        rather than path objects.
+
+        This is meant for bulk operations over a large number of files
+        that only need the paths, such as :meth:`remove_dir`.
+        A path object can be created from a yielded string when needed.
+
+        This default implementation takes the strings from :meth:`riterdir`.
+        Subclasses may override it to skip creating the path objects.
+        """
+        for p in self.riterdir():
+            yield p._path
+
+    def rmrf(
+        self, *, quiet: bool = True, concurrent: bool = False, count: bool = True
+    ) -> int | None:
         """Remove the current file or dir (i.e. ``self``) recursively.
 
         Analogous to the Linux command ``rm -rf``, hence the name of this method.
 
-        Return the number of files removed.
+        Return the number of files removed. If ``count`` is ``False``, return ``None``;
+        this allows a subclass to skip enumerating the files if it can remove
+        a whole dir without doing so.
 
         For example, if these blobs are present::
 
@@ -823,21 +1194,116 @@ class Upath(abc.ABC):
 
         ``concurrent`` is ``False`` by default because this method is often used in
         ``__del__`` of user classes, and thread pool is problematic in ``__del__``.
+        If ``concurrent`` is ``True``, the removal of ``self`` as a file runs in a thread
+        while the removal of ``self`` as a dir gets going, because both may
+        involve network calls, and usually only one of them has anything to remove.
         """
         if self._path == "/":
             raise UnsupportedOperation("`rmrf` not allowed on root directory")
-        try:
-            self.remove_file()
-        except (FileNotFoundError, IsADirectoryError):
-            n = 0
+
+        def remove_file():
+            try:
+                self.remove_file()
+            except (FileNotFoundError, IsADirectoryError):
+                return 0
+            return 1
+
+        if concurrent:
+            executor = get_shared_thread_pool("upathlib", MAX_THREADS)
+            fut = executor.submit(remove_file)
         else:
-            n = 1
+            n = remove_file()
         try:
             m = self.remove_dir(quiet=quiet, concurrent=concurrent)
         except FileNotFoundError:
             m = 0
+        if concurrent:
+            n = fut.result()
+        if not count:
+            return None
         return n + m
 
+    @staticmethod
+    def _acquire_with_backoff(
+        try_acquire: Callable[[], bool],
+        *,
+        timeout: float,
+        initial: float = 0.001,
+        maximum: float = 0.1,
+        multiplier: float = 2.0,
+    ) -> bool:
+        """
+        Call ``try_acquire`` until it returns ``True``, or ``timeout`` seconds have passed,
+        in which case return ``False``. ``try_acquire`` should make one non-blocking
+        attempt to acquire a lock.
+
+        The wait between attempts starts at ``initial`` seconds and grows by ``multiplier``
+        up to ``maximum``, with some random jitter. This way a lock that is released quickly
+        is picked up with little delay, while a long wait does not poll too often.
+        Subclasses may use this helper in implementing :meth:`lock`.
+
+        ``timeout=0`` means exactly one attempt.
+        """
+        deadline = time.perf_counter() + timeout
+        delay = initial
+        while True:
+            if try_acquire():
+                return True
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay * random.uniform(0.5, 1.0), remaining))
+            delay = min(delay * multiplier, maximum)
+
+    @contextlib.contextmanager
+    def read_consistent(self) -> Self:
+        """Check that the current file (i.e. ``self``) is not changed
+        while it is being read in the code block.
+
+        This is a lighter alternative to :meth:`lock` for readers of a file
+        that is rarely written. No lock is acquired. Instead, the file info
+        (modification time and size) is taken on entry, and taken again on exit.
+        If they differ, ``StaleReadError`` is raised, and the caller may read again.
+
+        Use this when writes are rare, so that a reader seldom has to retry,
+        and reading does not change anything on the storage system.
+        Because nothing is locked, a reader does not block writers,
+        nor is it blocked by them. Use :meth:`lock` instead when the file is
+        written often, as retrying would be more costly than waiting for the lock,
+        or when writers also use :meth:`lock` and readers must not see a partial write.
+        The check relies on the granularity of the modification time
+        on the storage system.
+
+        Example::
+
+            f = Upath('abc.txt')
+            with f.read_consistent():
+                data = f.read_bytes()
+
+        This yields ``self``.
+        """
+        info = self.file_info()
+        yield self
+        info2 = self.file_info()
+        if (info is None) != (info2 is None) or (
+            info is not None and (info.mtime, info.size) != (info2.mtime, info2.size)
+        ):
+            raise StaleReadError(f"File changed while being read: '{self}'")
+
+    def _lock_file(self, suffix: str = ".lock") -> Self:
+        """
+        Return the helper file, named by appending ``suffix`` to the name of ``self``,
+        that a subclass may use to implement :meth:`lock`.
+
+        The object is cached, so that code that locks the same path over and over
+        does not create a new path object for every acquisition.
+        """
+        z = self._lock_file_
+        if z is None or z[0] != suffix:
+            z = (suffix, self.with_name(self.name + suffix))
+            self._lock_file_ = z
+        return z[1]
+
     @contextlib.contextmanager
     @abc.abstractmethod
     def lock(self, *, timeout: int = None) -> Self:
@@ -850,6 +1316,10 @@ class Upath(abc.ABC):
 
         ``timeout=0`` is a valid input, meaning making exactly one attempt to acquire a lock.
 
+        An implementation should make its first attempt right away and wait only
+        if that attempt fails, so that acquiring an uncontended lock involves no waiting.
+        The helper :meth:`_acquire_with_backoff` works this way.
+
         Once a lock is acquired, it will not expire until this contextmanager exits.
         In other words, this is timeout for the "lock acquisition", not for the
         lock itself. Actual waiting time could be slightly longer or shorter.
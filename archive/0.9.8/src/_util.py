@@ -2,7 +2,6 @@ import os
 import string
 import threading
 import warnings
-import weakref
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
@@ -52,7 +51,11 @@ def make_version(tag: str = None) -> str:
 
 # Copied from ``mpservice.concurrent.futures``.
 
-_global_thread_pools_: dict[str, ThreadPoolExecutor] = weakref.WeakValueDictionary()
+_global_thread_pools_: dict[str, ThreadPoolExecutor] = {}
+# A plain dict rather than a `weakref.WeakValueDictionary`: with weak references,
+# a pool was garbage-collected, along with its threads, as soon as the method using it
+# returned, and the next call had to start a new pool and new threads.
+# The pools are few (one per name) and their threads are started on demand.
 _global_thread_pools_lock: threading.Lock = threading.Lock()
 
 
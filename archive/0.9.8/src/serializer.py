@@ -3,7 +3,7 @@ import json
 import pickle
 import threading
 import zlib
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import Protocol, TypeVar
 
 import zstandard
@@ -30,16 +30,24 @@ PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
 
 
 @contextmanager
-def _gc(data):
-    turnedoff = False
-    if len(data) >= MEGABYTE * 10 and gc.isenabled():
-        gc.disable()
-        turnedoff = True
+def _gc_disabled():
+    gc.disable()
     try:
         yield
     finally:
-        if turnedoff:
-            gc.enable()
+        gc.enable()
+
+
+_GC_UNCHANGED = nullcontext()
+
+
+def _gc(data):
+    # Turn off garbage collection while deserializing a large payload,
+    # which creates many objects. For a small payload, return a shared
+    # no-op context manager rather than entering a generator-based one.
+    if len(data) >= MEGABYTE * 10 and gc.isenabled():
+        return _gc_disabled()
+    return _GC_UNCHANGED
 
 
 class Serializer(Protocol):
@@ -81,7 +89,10 @@ class JsonSerializer(Serializer):
 class PickleSerializer(Serializer):
     @classmethod
     def serialize(cls, x, *, protocol=None, **kwargs) -> bytes:
-        return pickle.dumps(x, protocol=protocol or PICKLE_PROTOCOL, **kwargs)
+        # `protocol=0` is a valid choice, hence not `protocol or PICKLE_PROTOCOL`.
+        if protocol is None:
+            protocol = PICKLE_PROTOCOL
+        return pickle.dumps(x, protocol=protocol, **kwargs)
 
     @classmethod
     def deserialize(cls, y, **kwargs):
@@ -138,8 +149,16 @@ class ZstdCompressor(threading.local):
         return self._decompressor.decompress(y)
 
 
+_zstd_compressor = ZstdCompressor()
+# Shared by all zstd serializers, so that each thread creates
+# the compression context for a given `(level, threads)` only once,
+# no matter which serializer class (or ``Upath.write_pickle_zstd``) it goes through.
+# `zlib` and `lz4.frame` expose one-shot functions only and have no
+# reusable context worth pooling.
+
+
 class ZstdPickleSerializer(PickleSerializer):
-    _compressor = ZstdCompressor()
+    _compressor = _zstd_compressor
 
     @classmethod
     def serialize(cls, x, *, level=ZSTD_LEVEL, threads=0, **kwargs) -> bytes:
@@ -201,7 +220,7 @@ else:
             return super().deserialize(y, **kwargs)
 
     class ZstdOrjsonSerializer(OrjsonSerializer):
-        _compressor = ZstdCompressor()
+        _compressor = _zstd_compressor
 
         @classmethod
         def serialize(cls, x, *, level=ZSTD_LEVEL, threads=0, **kwargs) -> bytes:
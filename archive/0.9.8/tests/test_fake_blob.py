@@ -67,6 +67,19 @@ class FakeBlobStore:
         except KeyError:
             raise ResourceNotFoundError(name)
 
+    def delete_blobs(self, bucket: str, names: list[str]) -> list[int]:
+        # Like a batch request, return the status code of each subrequest.
+        z = self._data[bucket]
+        codes = []
+        for name in names:
+            if name in z:
+                del z[name]
+                del self._meta[bucket][name]
+                codes.append(202)
+            else:
+                codes.append(404)
+        return codes
+
     def copy_blob(self, bucket: str, name: str, target: str, *, overwrite=False):
         self.write_bytes(
             bucket=bucket,
@@ -96,6 +109,8 @@ class FakeBlobUpath(BlobUpath):
     This also showcases the essential methods that
     a concrete subclass of BlobUpath needs to implement."""
 
+    _REMOVE_DIR_BATCH_SIZE = 4
+
     def __init__(self, *parts: str, bucket: str):
         super().__init__(*parts)
         self._bucket = bucket
@@ -141,6 +156,15 @@ class FakeBlobUpath(BlobUpath):
         except ResourceNotFoundError:
             raise FileNotFoundError(self)
 
+    def _remove_files_at(self, paths: list[str]) -> int:
+        n = 0
+        for code in _store.delete_blobs(self._bucket, paths):
+            if code == 404:
+                # Already removed.
+                continue
+            n += 1
+        return n
+
     @property
     def root(self) -> Self:
         return self.__class__("/", bucket=self._bucket)
@@ -159,3 +183,17 @@ def test_all():
         upathlib._tests.test_all(p)
     finally:
         p.rmrf()
+
+
+def test_remove_files_at_missing():
+    p = FakeBlobUpath("/tmp/test", bucket="bucket_a") / str(uuid4())
+    try:
+        for name in ("a.txt", "b.txt", "c/d.txt"):
+            (p / name).write_text(name)
+        paths = [(p / name)._path for name in ("a.txt", "x.txt", "c/d.txt")]
+        assert p._remove_files_at(paths) == 2
+        assert not (p / "a.txt").exists()
+        assert (p / "b.txt").exists()
+        assert p.rmrf() == 1
+    finally:
+        p.rmrf()
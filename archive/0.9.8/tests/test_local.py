@@ -1,9 +1,13 @@
+import io
 import os
 import pathlib
+import pickle
+import shutil
 from uuid import uuid4
 
 import pytest
 
+import upathlib._local
 import upathlib._tests
 from upathlib import LocalUpath, serializer
 
@@ -30,6 +34,47 @@ def test_localupath_init():
     assert str(p.path) == str(pathlib.Path(pathlib.Path.cwd(), "a", "b", "c", "d"))
 
 
+def test_name_parts():
+    for path in (
+        "/tmp/a/sales.txt.gz",
+        "/tmp/a/sales",
+        "/tmp/a/.bashrc",
+        "/tmp/a/..b.tar.gz",
+        "/tmp/a/b.",
+        "/tmp",
+        "/",
+    ):
+        p = LocalUpath(path)
+        pp = pathlib.Path(path)
+        assert p.path == pp
+        assert p.path is p.path
+        assert p.name == pp.name
+        assert p.stem == pp.stem
+        assert p.suffix == pp.suffix
+        assert p.suffixes == pp.suffixes
+        assert p.parent.path == pp.parent
+        if pp.name:
+            assert p.with_name("b.data").path == pp.with_name("b.data")
+            assert p.with_suffix(".bin").path == pp.with_suffix(".bin")
+            assert p.with_suffix("").path == pp.with_suffix("")
+            assert p.with_stem("c").path == pp.with_stem("c")
+        else:
+            with pytest.raises(ValueError):
+                p.with_name("b.data")
+    with pytest.raises(ValueError):
+        LocalUpath("/tmp/a.txt").with_suffix("txt")
+    with pytest.raises(ValueError):
+        LocalUpath("/tmp/a.txt").with_name("b/c")
+
+
+def test_compare():
+    a, b = LocalUpath("/tmp/a"), LocalUpath("/tmp/b")
+    assert a < b and a <= b and b > a and b >= a
+    assert a <= LocalUpath("/tmp/a") and a >= LocalUpath("/tmp/a")
+    assert not a > b and not b <= a
+    assert sorted([b, a]) == [a, b]
+
+
 def test_all(test_path):
     upathlib._tests.test_all(test_path)
 
@@ -40,6 +85,39 @@ def test_lock():
     # the implementation leaves the lock file around.
     upathlib._tests.test_lock(test_path)
 
+    f = test_path / "a.txt"
+    assert f._lock_file() == test_path / "a.txt.lock"
+    assert f._lock_file() is f._lock_file()
+    assert f._lock_file(".lck") == test_path / "a.txt.lck"
+
+
+def test_write_text_in_chunks(test_path, monkeypatch):
+    monkeypatch.setattr(LocalUpath, "_WRITE_TEXT_CHUNK_SIZE", 3)
+    f = test_path / "a.txt"
+    text = "abc\u00e9\u4e2d\U0001f600xyz\r\n"
+    f.write_text(text)
+    assert f.read_bytes() == text.encode()
+    f.write_text(text, overwrite=True, encoding="utf-16")
+    assert f.read_text(encoding="utf-16") == text
+    with pytest.raises(FileExistsError):
+        f.write_text(text)
+    with pytest.raises(UnicodeError):
+        (test_path / "b.txt").write_text(text, encoding="ascii")
+    assert not (test_path / "b.txt").exists()
+    with pytest.raises(UnicodeError):
+        f.write_text(text, overwrite=True, encoding="ascii")
+    assert f.read_text(encoding="utf-16") == text
+
+
+def test_read_consistent(test_path):
+    f = test_path / "a.txt"
+    f.write_text("abc")
+    with f.read_consistent():
+        assert f.read_text() == "abc"
+    with pytest.raises(upathlib.StaleReadError):
+        with f.read_consistent():
+            f.write_text("abcd", overwrite=True)
+
 
 def test_rename(test_path):
     p = test_path
@@ -63,11 +141,88 @@ def test_rename(test_path):
     assert not (p / "c").exists()
 
 
+def test_riterdir(test_path):
+    p = test_path
+    names = ["a.txt", "b/c.txt", "b/d/e.txt", "b/d/f/g/h.txt", "i/j.txt"]
+    for name in names:
+        (p / name).write_text(name)
+    assert sorted(p.riterdir()) == sorted(p / name for name in names)
+    assert sorted(p.riterdir_paths()) == sorted(x._path for x in p.riterdir())
+    assert list((p / "a.txt").riterdir()) == []
+    assert list((p / "nonexistent").riterdir()) == []
+
+    assert sorted(p.iterdir_depth(1)) == [p / "a.txt"]
+    assert sorted(p.iterdir_depth(3)) == sorted(
+        p / name for name in names if name.count("/") < 3
+    )
+    assert sorted(p.iterdir_depth(100)) == sorted(p.riterdir())
+    assert sorted(upathlib.Upath.iterdir_depth(p, 3)) == sorted(p.iterdir_depth(3))
+
+
+def test_rmrf(test_path):
+    p = test_path
+    for name in ("a.txt", "b/c.txt", "b/d/e.txt"):
+        (p / name).write_text(name)
+    assert p.rmrf() == 3
+    assert not p.exists()
+
+    for name in ("a.txt", "b/c.txt", "b/d/e.txt"):
+        (p / name).write_text(name)
+    assert p.rmrf(count=False) is None
+
+    # Symlinks are removed, not followed, and are counted as files.
+    outside = p.parent / (p.name + "-outside")
+    try:
+        (outside / "x.txt").write_text("x")
+        (outside / "y.txt").write_text("y")
+        (p / "a.txt").write_text("a")
+        os.makedirs((p / "b").path)
+        os.symlink(outside.path, (p / "b/link").path)
+        os.symlink(p.path, (p / "b/loop").path)
+        assert p.rmrf() == 3
+        assert not p.exists()
+        assert (outside / "x.txt").is_file()
+    finally:
+        outside.rmrf()
+    assert not p.exists()
+    assert p.rmrf(count=False) is None
+
+
 def test_pathlike(test_path):
     p = test_path
     p.write_text("abc")
     with open(p) as file:
         assert file.read() == "abc"
+    assert isinstance(p, os.PathLike)
+    assert os.fspath(p) == str(p)
+    assert p.exists() and p.parent.exists()
+    assert not (p / "x").exists()
+    assert not hasattr(p, "__dict__")
+
+
+def test_intern_paths(monkeypatch):
+    monkeypatch.setattr(LocalUpath, "_INTERN_PATHS", True)
+    name = "a_rather_long_directory_name/and_a_file_name.txt"
+    p = LocalUpath("/tmp", name)
+    q = LocalUpath("/tmp").joinpath(name)
+    assert p._path is q._path
+    assert pickle.loads(pickle.dumps(p))._path is p._path
+
+
+def test_write_pickle(test_path):
+    p = test_path / "data.pickle"
+    data = {"a": list(range(100000)), "b": "x" * 1000}
+    p.write_pickle(data)
+    assert p.read_bytes() == serializer.PickleSerializer.serialize(data)
+    with pytest.raises(FileExistsError):
+        p.write_pickle(data)
+    p.write_pickle(data, overwrite=True, protocol=0)
+    assert p.read_pickle() == data
+
+    q = test_path / "bad.pickle"
+    with pytest.raises(Exception):
+        q.write_pickle([1, lambda: 2])
+    assert not q.exists()
 
 
 def test_pickle(test_path):
@@ -87,3 +242,57 @@ def test_pickle(test_path):
 
     serializer.Lz4PickleSerializer.dump(data, pp, overwrite=True)
     assert serializer.Lz4PickleSerializer.load(pp) == data
+
+
+def test_copy_file_to_symlink_of_source(test_path, monkeypatch):
+    monkeypatch.setattr(LocalUpath, "_CLONE_FILES", True)
+    src = test_path / "src.bin"
+    src.write_bytes(b"0123456789a")
+    os.symlink(src.path, (test_path / "link.bin").path)
+    with pytest.raises(shutil.SameFileError):
+        (test_path / "link.bin").copy_file(src, overwrite=True)
+    assert src.read_bytes() == b"0123456789a"
+
+
+def test_write_bytes_from_failing_reader(test_path):
+    class Reader:
+        def __init__(self):
+            self._n = 0
+
+        def read(self, size=-1):
+            self._n += 1
+            if self._n > 2:
+                raise OSError("read failed")
+            return b"x" * 10
+
+    f = test_path / "a.bin"
+    with pytest.raises(OSError):
+        f.write_bytes(Reader())
+    assert not f.exists()
+    with pytest.raises(TypeError):
+        f.write_bytes("abc")
+    assert not f.exists()
+
+    f.write_bytes(b"original")
+    with pytest.raises(OSError):
+        f.write_bytes(Reader(), overwrite=True)
+    with pytest.raises(TypeError):
+        f.write_bytes("abc", overwrite=True)
+    assert f.read_bytes() == b"original"
+    assert [p.name for p in test_path.iterdir()] == ["a.bin"]
+    f.write_bytes(io.BytesIO(b"new"), overwrite=True)
+    assert f.read_bytes() == b"new"
+
+
+def test_clone_file_unsupported_per_device(test_path, monkeypatch):
+    monkeypatch.setattr(LocalUpath, "_CLONE_FILES", True)
+    monkeypatch.setattr(upathlib._local, "_NO_CLONE_DEVICES", set())
+    src = test_path / "src.bin"
+    src.write_bytes(b"0123456789a")
+    for name in ("a.bin", "b.bin"):
+        (test_path / name).copy_file(src)
+        assert (test_path / name).read_bytes() == b"0123456789a"
+    # Whether or not this file system supports cloning,
+    # cloning stays on for other file systems.
+    assert LocalUpath._CLONE_FILES
+    assert upathlib._local._NO_CLONE_DEVICES <= {os.stat(src.path).st_dev}
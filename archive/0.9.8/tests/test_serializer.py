@@ -1,3 +1,4 @@
+import pickle
 from concurrent.futures import ThreadPoolExecutor
 
 from upathlib.serializer import (
@@ -32,6 +33,15 @@ def test_all():
         assert z == data
 
 
+def test_pickle_protocol():
+    assert PickleSerializer.serialize(data) == pickle.dumps(
+        data, protocol=pickle.HIGHEST_PROTOCOL
+    )
+    assert PickleSerializer.serialize(data, protocol=0) == pickle.dumps(
+        data, protocol=0
+    )
+
+
 def test_zstdcompressor():
     me = ZstdCompressor()
     assert len(me._compressor) == 0
@@ -54,6 +64,14 @@ def test_zstdcompressor():
     assert me._decompressor == 8
 
 
+def test_shared_zstd_compressor():
+    assert ZstdPickleSerializer._compressor is ZstdOrjsonSerializer._compressor
+    ZstdPickleSerializer.serialize(data)
+    n = len(ZstdPickleSerializer._compressor._compressor)
+    ZstdOrjsonSerializer.serialize(data)
+    assert len(ZstdOrjsonSerializer._compressor._compressor) == n
+
+
 def _check(data):
     y = ZstdPickleSerializer.serialize(data)
     z = ZstdPickleSerializer.deserialize(y)